@@ -11,9 +11,9 @@ from pyreact.router import (
     use_route,
     use_navigate,
     use_query_params,
+    use_route_params,
     use_routes_catalog,
 )
-from pyreact.router.route import use_route_params
 from router_agent import RouterAgent as ProjectRouterAgent
 import dspy
 import os
@@ -1,7 +1,13 @@
-from .bootstrap import bootstrap
-from .terminal import read_terminal_and_invoke
-from .web import run_web
-from .app_runner import AppRunner
+from importlib import import_module
+
+# Loaded on first access, so importing one entry point (e.g. the terminal
+# reader) does not pull in the runner and web stack as well
+_LAZY_EXPORTS = {
+    "bootstrap": ".bootstrap",
+    "read_terminal_and_invoke": ".terminal",
+    "run_web": ".web",
+    "AppRunner": ".app_runner",
+}
 
 __all__ = [
     "run_terminal",
@@ -10,3 +16,12 @@ __all__ = [
     "AppRunner",
     "read_terminal_and_invoke",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
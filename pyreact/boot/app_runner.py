@@ -1,14 +1,20 @@
 import asyncio
+import concurrent.futures
 import inspect
 import threading
 import time
 from typing import Optional, Callable
 
 from pyreact.core.hook import HookContext
-from pyreact.core.runtime import run_renders, schedule_rerender, get_render_idle
+from pyreact.core.message_buffer import MessageBuffer
+from pyreact.core.runtime import (
+    run_renders,
+    schedule_rerender,
+    get_render_signal,
+    wait_render_idle,
+)
 from pyreact.input.bus import InputBus
 from pyreact.router.nav_service import NavService
-from pyreact.web.console import MessageBuffer
 
 
 def _emit_text_and_submit(bus: InputBus, text: str) -> None:
@@ -38,6 +44,7 @@ class AppRunner:
         self._ready: threading.Event = threading.Event()
 
         self._root_ctx: Optional[HookContext] = None
+        self._navsvc: Optional[NavService] = None
 
         # Web bridge callbacks (set by server): executed from runner thread
         self._on_nav: Optional[Callable[[str], None]] = None
@@ -59,21 +66,17 @@ class AppRunner:
         if self._stopping or self._bus is None:
             return
 
-        async def _do_emit_and_maybe_wait(txt: str, should_wait: bool):
-            _emit_text_and_submit(self._bus, txt)
-            if should_wait:
-                # Let at least one render cycle commit before returning
-                await asyncio.sleep(0)
-                await get_render_idle().wait()
+        # Emitting is synchronous: a plain callback is enough
+        self._loop.call_soon_threadsafe(_emit_text_and_submit, self._bus, text)
+        if not wait:
+            return
 
-        fut = asyncio.run_coroutine_threadsafe(
-            _do_emit_and_maybe_wait(text, wait), self._loop
-        )
-        if wait:
-            try:
-                fut.result(timeout=timeout)
-            except Exception:
-                return
+        # Scheduled after the emit callback, so renders it triggered are queued
+        fut = asyncio.run_coroutine_threadsafe(wait_render_idle(), self._loop)
+        try:
+            fut.result(timeout=timeout)
+        except Exception:
+            return
 
     def shutdown(self) -> None:
         """Stop render loop and background threads."""
@@ -96,21 +99,20 @@ class AppRunner:
         # Remove nav listener
         try:
             if self._nav_listener is not None:
-                navsvc = self._root_ctx.get_service("nav_service", NavService)
                 try:
-                    navsvc.subs.remove(self._nav_listener)
+                    self._navsvc.subs.remove(self._nav_listener)
                 except Exception:
                     pass
                 self._nav_listener = None
         except Exception:
             pass
 
-        # Nudge the loop so the sleep wakes up promptly
-        def _noop():
-            return None
+        # Wake the loop so the render wait returns promptly
+        def _wake():
+            get_render_signal().set()
 
         try:
-            self._loop.call_soon_threadsafe(_noop)
+            self._loop.call_soon_threadsafe(_wake)
         except Exception:
             pass
         # Wait loop thread to exit
@@ -123,12 +125,8 @@ class AppRunner:
         if self._stopping or self._root_ctx is None:
             return
 
-        async def _task():
-            self._root_ctx.render_tree()
-
-        fut = asyncio.run_coroutine_threadsafe(_task(), self._loop)
         try:
-            fut.result(timeout=1.0)
+            self._call_in_loop(self._root_ctx.render_tree)
         except Exception:
             pass
 
@@ -136,7 +134,7 @@ class AppRunner:
         if self._stopping:
             return
 
-        async def _task():
+        def _task():
             try:
                 from pyreact.core.debug import print_last_trace
 
@@ -144,9 +142,8 @@ class AppRunner:
             except Exception:
                 print("\x1b[90m[debug]\x1b[0m Render trace not available.")
 
-        fut = asyncio.run_coroutine_threadsafe(_task(), self._loop)
         try:
-            fut.result(timeout=1.0)
+            self._call_in_loop(_task)
         except Exception:
             pass
 
@@ -154,8 +151,7 @@ class AppRunner:
         if self._stopping or not dest:
             return
 
-        navsvc = self._root_ctx.get_service("nav_service", NavService)
-        go = getattr(navsvc, "navigate", None)
+        go = getattr(self._navsvc, "navigate", None)
         if callable(go):
             if inspect.iscoroutinefunction(go):
                 asyncio.run_coroutine_threadsafe(
@@ -175,23 +171,20 @@ class AppRunner:
                     pass
 
     def current_route(self) -> dict:
-        if self._stopping:
+        navsvc = self._navsvc
+        if self._stopping or navsvc is None:
             return {"path": "", "query": {}, "fragment": ""}
 
-        async def _task():
-            try:
-                navsvc = self._root_ctx.get_service("nav_service", NavService)
-                return {
-                    "path": navsvc.get_path(),
-                    "query": navsvc.get_query_params(),
-                    "fragment": navsvc.get_fragment(),
-                }
-            except Exception:
-                return {"path": "", "query": {}, "fragment": ""}
+        def _task():
+            return {
+                "path": navsvc.get_path(),
+                "query": navsvc.get_query_params(),
+                "fragment": navsvc.get_fragment(),
+            }
 
-        fut = asyncio.run_coroutine_threadsafe(_task(), self._loop)
+        # Only the cross-thread wait can fail (e.g. timeout while the loop is busy)
         try:
-            return fut.result(timeout=1.0)
+            return self._call_in_loop(_task)
         except Exception:
             return {"path": "", "query": {}, "fragment": ""}
 
@@ -244,6 +237,23 @@ class AppRunner:
     # -------------------------------
     # Internal: loop thread
     # -------------------------------
+    def _call_in_loop(self, fn: Callable[[], object], timeout: float = 1.0):
+        """Run a synchronous ``fn`` on the loop thread and block for its result.
+
+        Uses ``call_soon_threadsafe`` with a plain ``concurrent.futures.Future``
+        so no coroutine or Task is created for trivial bodies.
+        """
+        fut: concurrent.futures.Future = concurrent.futures.Future()
+
+        def _call():
+            try:
+                fut.set_result(fn())
+            except Exception as exc:
+                fut.set_exception(exc)
+
+        self._loop.call_soon_threadsafe(_call)
+        return fut.result(timeout=timeout)
+
     def _thread_main(self) -> None:
         asyncio.set_event_loop(self._loop)
         self._loop.run_until_complete(self._loop_main())
@@ -260,10 +270,10 @@ class AppRunner:
         )
         schedule_rerender(self._root_ctx, reason="app startup")
         self._bus = self._root_ctx.get_service("input_bus", InputBus)
+        self._navsvc = self._root_ctx.get_service("nav_service", NavService)
 
         # Bridge navigation events to server publisher
         try:
-            navsvc = self._root_ctx.get_service("nav_service", NavService)
 
             def _nav_listener(path: str) -> None:
                 try:
@@ -272,7 +282,7 @@ class AppRunner:
                 except Exception:
                     pass
 
-            navsvc.subs.append(_nav_listener)
+            self._navsvc.subs.append(_nav_listener)
             self._nav_listener = _nav_listener
         except Exception:
             pass
@@ -295,11 +305,24 @@ class AppRunner:
 
         self._ready.set()
 
+        # Render when work is signaled; the fps interval is only a periodic tick
         interval = 1.0 / max(1, self._fps)
+        signal = get_render_signal()
+        deadline = time.monotonic() + interval
         try:
             while not self._stopping:
-                await run_renders()
-                await asyncio.sleep(interval)
+                if await run_renders():
+                    # More work is pending: just yield to let it be queued
+                    await asyncio.sleep(0)
+                    continue
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    deadline = time.monotonic() + interval
+                    continue
+                try:
+                    await asyncio.wait_for(signal.wait(), timeout=timeout)
+                except TimeoutError:
+                    deadline += interval
         finally:
             try:
                 if self._root_ctx is not None:
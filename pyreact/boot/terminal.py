@@ -1,6 +1,65 @@
+from __future__ import annotations
+
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from pyreact.core.debug import BOLD, CYAN, GRAY, RESET, YELLOW
+
+if TYPE_CHECKING:
+    from .app_runner import AppRunner
+
+_ROUTE_OPEN = f"\n{BOLD}{CYAN}=== Route ==={RESET}"
+_ROUTE_CLOSE = f"{BOLD}{CYAN}=============== {RESET}\n"
+_ROUTE_PATH = f"{GRAY}path:{RESET} {YELLOW}{{}}{RESET}"
+_ROUTE_QUERY = f"{GRAY}query:{RESET} {YELLOW}{{}}{RESET}"
+_ROUTE_FRAGMENT = f"{GRAY}fragment:{RESET} {YELLOW}{{}}{RESET}"
+_ROUTE_UNAVAILABLE = f"{GRAY}[debug]{RESET} Route not available."
+_NAV_USAGE = f"{GRAY}Usage:{RESET} {YELLOW}:nav /path[?query][#fragment]{RESET}"
+
+
+def _cmd_tree(app: AppRunner, _args: str) -> None:
+    app.print_vnode_tree()
+
+
+def _cmd_trace(app: AppRunner, _args: str) -> None:
+    app.print_render_trace()
+
 
-from .app_runner import AppRunner
+def _cmd_route(app: AppRunner, _args: str) -> None:
+    # current_route() never raises; an empty path means the router is not ready
+    info = app.current_route()
+    path = info["path"]
+    if not path:
+        print(_ROUTE_UNAVAILABLE)
+        return
+    print(_ROUTE_OPEN)
+    print(_ROUTE_PATH.format(path))
+    if info["query"]:
+        print(_ROUTE_QUERY.format(info["query"]))
+    if info["fragment"]:
+        print(_ROUTE_FRAGMENT.format(info["fragment"]))
+    print(_ROUTE_CLOSE)
+
+
+def _cmd_nav(app: AppRunner, args: str) -> None:
+    dest = args.strip()
+    if not dest:
+        print(_NAV_USAGE)
+    else:
+        app.nav(dest)
+
+
+_COMMANDS = MappingProxyType(
+    {
+        "tree": _cmd_tree,
+        "trace": _cmd_trace,
+        "route": _cmd_route,
+        "nav": _cmd_nav,
+    }
+)
+_QUIT_COMMANDS = frozenset(("q", "quit", "exit"))
 
 
 async def read_terminal_and_invoke(
@@ -15,13 +74,18 @@ async def read_terminal_and_invoke(
       - :nav <dest>      → app.nav(dest)
       - :q|:quit|:exit   → quit
 
-    - Reading happens via run_in_executor to avoid blocking the event loop.
+    - Reading happens on a single dedicated stdin thread (run_in_executor) to
+      avoid blocking the event loop.
     - Stop the loop by sending :q / :quit / :exit (case-sensitive) or Ctrl+C.
     """
     loop = asyncio.get_running_loop()
+
+    stdin_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="pyreact-stdin"
+    )
     try:
         while True:
-            txt = await loop.run_in_executor(None, input, prompt)
+            txt = await loop.run_in_executor(stdin_executor, input, prompt)
             s = (txt or "").strip()
             if s.startswith(":") or s.startswith("/"):
                 rest = s[1:].strip()
@@ -29,53 +93,13 @@ async def read_terminal_and_invoke(
                     continue
                 parts = rest.split(None, 1)
                 cmd = parts[0]
-                args_str = parts[1] if len(parts) > 1 else ""
-                if cmd in ("q", "quit", "exit"):
+                if cmd in _QUIT_COMMANDS:
                     break
-                if cmd == "tree":
-                    app.print_vnode_tree()
-                    continue
-                if cmd == "trace":
-                    app.print_render_trace()
-                    continue
-                if cmd == "route":
-                    try:
-                        info = app.current_route()
-                        BOLD = "\x1b[1m"
-                        CYAN = "\x1b[36m"
-                        RESET = "\x1b[0m"
-                        GRAY = "\x1b[90m"
-                        YELLOW = "\x1b[33m"
-                        print(f"\n{BOLD}{CYAN}=== Route ==={RESET}")
-                        print(
-                            f"{GRAY}path:{RESET} {YELLOW}{info.get('path', '')}{RESET}"
-                        )
-                        q = info.get("query", {}) or {}
-                        if q:
-                            print(f"{GRAY}query:{RESET} {YELLOW}{q}{RESET}")
-                        frag = info.get("fragment", "") or ""
-                        if frag:
-                            print(f"{GRAY}fragment:{RESET} {YELLOW}{frag}{RESET}")
-                        print(f"{BOLD}{CYAN}=============== {RESET}\n")
-                    except Exception:
-                        print("\x1b[90m[debug]\x1b[0m Route not available.")
-                    continue
-                if cmd == "nav":
-                    dest = (args_str or "").strip()
-                    if not dest:
-                        GRAY = "\x1b[90m"
-                        RESET = "\x1b[0m"
-                        YELLOW = "\x1b[33m"
-                        print(
-                            f"{GRAY}Usage:{RESET} {YELLOW}:nav /path[?query][#fragment]{RESET}"
-                        )
-                    else:
-                        app.nav(dest)
-                    continue
+                handler = _COMMANDS.get(cmd)
+                if handler is not None:
+                    handler(app, parts[1] if len(parts) > 1 else "")
                 # Unknown command → ignore
                 continue
-            if s in (":q", ":quit", ":exit"):
-                break
             try:
                 app.invoke(txt, wait=wait)
             except Exception:
@@ -83,3 +107,5 @@ async def read_terminal_and_invoke(
                 pass
     except (KeyboardInterrupt, SystemExit):
         pass
+    finally:
+        stdin_executor.shutdown(wait=False)
@@ -1,18 +1,25 @@
 from pyreact.core.core import component, hooks
 from pyreact.input.bus import InputBus, Event
 
+_INPUT_BUS_KEY = "input_bus"
+
+
+def _get_input_bus() -> InputBus:
+    return hooks.get_service(_INPUT_BUS_KEY, InputBus)
+
 
 @component
 def Keystroke(on_submit=None):
-    state, set_state = hooks.use_state({"text": "", "submit_ver": 0})
-    bus: InputBus = hooks.get_service("input_bus", InputBus)
+    text, set_text = hooks.use_state("")
+    submit_ver, set_submit_ver = hooks.use_state(0)
+    bus: InputBus = hooks.use_memo(_get_input_bus, [])
 
     # Bus handler
     def _handle(ev: Event):
-        t = ev.get("type")
-        v = ev.get("value", "") or ""
-        if t == "submit":
-            set_state(lambda s: {"text": v, "submit_ver": s["submit_ver"] + 1})
+        # Only submit events are handled; skip the value lookup for the rest
+        if ev.get("type") == "submit":
+            set_text(ev.get("value") or "")
+            set_submit_ver(lambda n: n + 1)
 
     handler = hooks.use_callback(_handle, deps=[])
 
@@ -23,10 +30,10 @@ def Keystroke(on_submit=None):
 
     def _on_submit_effect():
         if (
-            on_submit is not None and state["submit_ver"] > 0
+            on_submit is not None and submit_ver > 0
         ):  # on_submit: triggers only after at least one submit
-            on_submit(state["text"])
+            on_submit(text)
 
-    hooks.use_effect(_on_submit_effect, [state["submit_ver"]])
+    hooks.use_effect(_on_submit_effect, [submit_ver])
 
     return []
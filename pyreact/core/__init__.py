@@ -4,7 +4,7 @@ from .provider import create_context
 from .runtime import schedule_rerender, run_renders
 from .core import VNode
 from .message_buffer import MessageBuffer
-from .core import component, hooks
+from .core import component, hooks, memo
 
 __all__ = [
     "HookContext",
@@ -15,4 +15,5 @@ __all__ = [
     "MessageBuffer",
     "component",
     "hooks",
+    "memo",
 ]
@@ -27,9 +27,22 @@ class VNode:
 
 def component(fn):
     @wraps(fn)
-    def wrapper(*, key=None, __internal=False, **props):
-        if __internal:
-            return fn(**props)
+    def wrapper(*, key=None, **props):
         return VNode(wrapper, props=props, key=key)
 
+    # Undecorated body, called directly by HookContext.render
+    wrapper.raw = fn
+    wrapper.memo = False
     return wrapper
+
+
+def memo(comp):
+    """Skip re-rendering ``comp`` when its parent passes shallow-equal props
+    and it has no update of its own scheduled (like ``React.memo``).
+
+    Apply on top of ``@component``. Context consumers below a skipped component
+    still update through ``Context.set``; a ``Provider`` value prop change is
+    only seen by descendants that render.
+    """
+    comp.memo = True
+    return comp
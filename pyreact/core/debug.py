@@ -6,9 +6,11 @@ expected attributes: ``name``, optional ``key``, optional ``props`` and
 ``children`` (iterable of similar nodes).
 """
 
+import sys
 import time
+from collections import deque
 from contextvars import ContextVar
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 # ANSI constants (single source for this module)
 RESET = "\x1b[0m"
@@ -27,93 +29,135 @@ YELLOW = FG_YELLOW
 CYAN = FG_CYAN
 
 
+def _fmt_num(v, depth: int) -> str:
+    return f"{FG_BLUE}{repr(v)}{RESET}"
+
+
+def _fmt_str(v, depth: int) -> str:
+    s = v.replace("\n", "\\n")
+    text = s if len(s) <= 60 else s[:57] + "…"
+    return f"{FG_YELLOW}{repr(text)}{RESET}"
+
+
+def _fmt_none(v, depth: int) -> str:
+    return f"{FG_CYAN}{repr(v)}{RESET}"
+
+
+def _fmt_seq(v, depth: int) -> str:
+    return f"{FG_CYAN}[{len(v)}]{RESET}"
+
+
+def _fmt_dict(v, depth: int) -> str:
+    items = []
+    for i, (k, val) in enumerate(v.items()):
+        if i >= 5:
+            items.append(f"{DIM}…{RESET}")
+            break
+        if k == "children":
+            # Children can be very large; show only count
+            try:
+                clen = len(val)  # type: ignore[arg-type]
+            except Exception:
+                clen = "?"
+            items.append(f"{FG_CYAN}children{RESET}=[{FG_YELLOW}{clen}{RESET}]")
+        else:
+            items.append(f"{FG_CYAN}{k}{RESET}={_fmt_val(val, depth + 1)}")
+    body = ", ".join(items)
+    return "{" + body + "}"
+
+
+# Exact-type fast path for _fmt_val; subclasses go through the isinstance chain
+_FMT_DISPATCH = {
+    int: _fmt_num,
+    float: _fmt_num,
+    bool: _fmt_num,
+    str: _fmt_str,
+    type(None): _fmt_none,
+    list: _fmt_seq,
+    tuple: _fmt_seq,
+    dict: _fmt_dict,
+}
+
+
+def _fmt_val(v, depth: int = 0) -> str:
+    if depth > 1:
+        return f"{DIM}…{RESET}"
+    fmt = _FMT_DISPATCH.get(type(v))
+    if fmt is not None:
+        return fmt(v, depth)
+    if isinstance(v, (int, float)):
+        return _fmt_num(v, depth)
+    if isinstance(v, str):
+        return _fmt_str(v, depth)
+    if isinstance(v, (list, tuple)):
+        return _fmt_seq(v, depth)
+    if isinstance(v, dict):
+        return _fmt_dict(v, depth)
+    if callable(v):
+        name = getattr(v, "__name__", None) or getattr(
+            type(v), "__name__", "callable"
+        )
+        return f"{FG_GREEN}<fn {name}>{RESET}"
+    return f"{FG_GREEN}<{type(v).__name__}>{RESET}"
+
+
+def _render_tree_into(ctx, indent: int, lines: List[str]) -> None:
+    # Pre-order walk with an explicit stack (no recursion limit on deep trees)
+    stack = [(ctx, indent)]
+    while stack:
+        node, depth = stack.pop()
+        pad = "  " * depth
+        name = getattr(node, "name", type(node).__name__)
+        name_col = f"{FG_MAGENTA}{name}{RESET}"
+        key = getattr(node, "key", None)
+        if key is not None:
+            key_part = f" {FG_GRAY}key={RESET}{FG_YELLOW}{key!r}{RESET}"
+        else:
+            key_part = ""
+        props_val = _fmt_val(getattr(node, "props", {}))
+        props_part = f" {FG_GRAY}props={RESET}{props_val}"
+        lines.append(f"{pad}{FG_GRAY}-{RESET} {name_col}{key_part}{props_part}")
+
+        children = getattr(node, "children", None)
+        if children:
+            stack.extend((ch, depth + 1) for ch in reversed(children))
+
+
 def render_tree(ctx, indent: int = 0) -> None:
     """Pretty-print the tree starting at ``ctx`` to stdout.
 
     Expects ``ctx`` to have ``name``, optional ``key`` and ``props``
-    attributes, and ``children`` iterable.
+    attributes, and ``children`` iterable. The whole tree is formatted first
+    and written with a single ``sys.stdout.write``.
     """
-
-    pad = "  " * indent
-
+    lines: List[str] = []
     if indent == 0:
-        print(f"{BOLD}{CYAN}=== VNode Tree ==={RESET}")
-
-    def _fmt_val(v, depth: int = 0):
-        # ANSI color helpers available via closure below
-        if depth > 1:
-            return f"{DIM}…{RESET}"
-        if isinstance(v, (int, float)):
-            return f"{FG_BLUE}{repr(v)}{RESET}"
-        if isinstance(v, str):
-            s = v.replace("\n", "\\n")
-            text = s if len(s) <= 60 else s[:57] + "…"
-            return f"{FG_YELLOW}{repr(text)}{RESET}"
-        if v is None or isinstance(v, bool):
-            return f"{FG_CYAN}{repr(v)}{RESET}"
-        if isinstance(v, (list, tuple)):
-            return f"{FG_CYAN}[{len(v)}]{RESET}"
-        if isinstance(v, dict):
-            items = []
-            for i, (k, val) in enumerate(v.items()):
-                if i >= 5:
-                    items.append(f"{DIM}…{RESET}")
-                    break
-                if k == "children":
-                    # Children can be very large; show only count
-                    try:
-                        clen = len(val)  # type: ignore[arg-type]
-                    except Exception:
-                        clen = "?"
-                    items.append(f"{FG_CYAN}children{RESET}=[{FG_YELLOW}{clen}{RESET}]")
-                else:
-                    items.append(f"{FG_CYAN}{k}{RESET}={_fmt_val(val, depth + 1)}")
-            body = ", ".join(items)
-            return "{" + body + "}"
-        if callable(v):
-            name = getattr(v, "__name__", None) or getattr(
-                type(v), "__name__", "callable"
-            )
-            return f"{FG_GREEN}<fn {name}>{RESET}"
-        return f"{FG_GREEN}<{type(v).__name__}>{RESET}"  # ANSI helpers available from module scope
-
-    name = getattr(ctx, "name", type(ctx).__name__)
-    name_col = f"{FG_MAGENTA}{name}{RESET}"
-    if getattr(ctx, "key", None) is not None:
-        key_part = f" {FG_GRAY}key={RESET}{FG_YELLOW}{getattr(ctx, 'key')!r}{RESET}"
-    else:
-        key_part = ""
-    props_val = _fmt_val(getattr(ctx, "props", {}))
-    props_part = f" {FG_GRAY}props={RESET}{props_val}"
-    print(f"{pad}{FG_GRAY}-{RESET} {name_col}{key_part}{props_part}")
-
-    for ch in getattr(ctx, "children", []) or []:
-        render_tree(ch, indent + 1)
-
+        lines.append(f"{BOLD}{CYAN}=== VNode Tree ==={RESET}")
+    _render_tree_into(ctx, indent, lines)
     if indent == 0:
-        print(f"{BOLD}{CYAN}==================={RESET}\n")
+        lines.append(f"{BOLD}{CYAN}==================={RESET}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ----------------------------------------------------------------------------
 # Render trace instrumentation
 # ----------------------------------------------------------------------------
 
-_TRACE_CTX: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
-    "_TRACE_CTX", default=None
-)
+# Events list of the trace being recorded. Renders run on a single loop
+# thread, so a plain module global is enough (no ContextVar lookup per event).
+_CURRENT_EVENTS: Optional[List[Dict[str, Any]]] = None
 _TRACE_DEPTH: ContextVar[int] = ContextVar("_TRACE_DEPTH", default=0)
 _TRACE_ENABLED: bool = False
 
 # Keep a log of recent traces (each trace is a dict with events)
-_TRACE_LOG: List[Dict[str, Any]] = []
 _TRACE_LOG_LIMIT = 50
+_TRACE_LOG: Deque[Dict[str, Any]] = deque(maxlen=_TRACE_LOG_LIMIT)
 
 
 def _push_trace_event(event: Dict[str, Any]) -> None:
-    trace = _TRACE_CTX.get()
-    if trace is None:
-        return
-    trace["events"].append(event)
+    events = _CURRENT_EVENTS
+    if events is not None:
+        events.append(event)
 
 
 def record_schedule(ctx: Any, reason: Optional[str] = None) -> None:
@@ -126,36 +170,37 @@ def record_schedule(ctx: Any, reason: Optional[str] = None) -> None:
 
 
 def start_trace(root_ctx: Any, reasons: Optional[List[str]] = None) -> None:
+    global _CURRENT_EVENTS
     if not _TRACE_ENABLED:
         return
+    # Event times ("t", "t0") are monotonic ns; "ts" is the one wall-clock read
+    t0 = time.monotonic_ns()
     trace = {
-        "id": f"tr-{int(time.time() * 1000)}-{id(root_ctx)}",
+        "id": f"tr-{t0}-{id(root_ctx)}",
         "root_id": id(root_ctx),
         "root_name": getattr(root_ctx, "name", type(root_ctx).__name__),
         "reasons": list(reasons or []),
         "ts": time.time(),
+        "t0": t0,
         "events": [],
     }
     _TRACE_LOG.append(trace)
-    if len(_TRACE_LOG) > _TRACE_LOG_LIMIT:
-        del _TRACE_LOG[:-_TRACE_LOG_LIMIT]
-    _TRACE_CTX.set(trace)
+    _CURRENT_EVENTS = trace["events"]
     _TRACE_DEPTH.set(0)
 
 
 def end_trace() -> None:
-    _TRACE_CTX.set(None)
+    global _CURRENT_EVENTS
+    _CURRENT_EVENTS = None
     _TRACE_DEPTH.set(0)
 
 
-def enter_render(ctx: Any) -> Any:
-    if not _TRACE_ENABLED:
-        return None
+def _enter_render_traced(ctx: Any) -> Any:
     depth = _TRACE_DEPTH.get()
     kind = "origin" if depth == 0 else "propagate"
     _push_trace_event(
         {
-            "t": time.time(),
+            "t": time.monotonic_ns(),
             "kind": kind,
             "depth": depth,
             "ctx_id": id(ctx),
@@ -166,7 +211,7 @@ def enter_render(ctx: Any) -> Any:
     return _TRACE_DEPTH.set(depth + 1)
 
 
-def exit_render(token: Any) -> None:
+def _exit_render_traced(token: Any) -> None:
     try:
         if token is not None:
             _TRACE_DEPTH.reset(token)
@@ -174,6 +219,20 @@ def exit_render(token: Any) -> None:
         pass
 
 
+def _enter_render_noop(ctx: Any) -> Any:
+    return None
+
+
+def _exit_render_noop(token: Any) -> None:
+    return None
+
+
+# Rebound by enable_tracing()/disable_tracing(); callers must look these up on
+# the module (``debug.enter_render``) so they see the current binding.
+enter_render = _enter_render_noop
+exit_render = _exit_render_noop
+
+
 def print_last_trace() -> None:
     if not _TRACE_LOG:
         print("\x1b[90m[debug]\x1b[0m no render trace available yet.")
@@ -209,13 +268,17 @@ def print_last_trace() -> None:
 
 
 def enable_tracing() -> None:
-    global _TRACE_ENABLED
+    global _TRACE_ENABLED, enter_render, exit_render
     _TRACE_ENABLED = True
+    enter_render = _enter_render_traced
+    exit_render = _exit_render_traced
 
 
 def disable_tracing() -> None:
-    global _TRACE_ENABLED
+    global _TRACE_ENABLED, enter_render, exit_render
     _TRACE_ENABLED = False
+    enter_render = _enter_render_noop
+    exit_render = _exit_render_noop
 
 
 def is_tracing_enabled() -> bool:
@@ -223,4 +286,4 @@ def is_tracing_enabled() -> bool:
 
 
 def clear_traces() -> None:
-    del _TRACE_LOG[:]
+    _TRACE_LOG.clear()
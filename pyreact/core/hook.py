@@ -3,19 +3,72 @@ from typing import Dict
 from weakref import WeakSet
 from .core import VNode
 from .runtime import schedule_rerender
+from . import debug as _debug
 import asyncio
+import sys
+import threading
 import warnings
 
+_MISSING = object()
+
+# Interned "__idx_N" positional keys shared by every render (grown on demand)
+_IDX_KEYS: list[str] = []
+
+
+def _idx_keys(n: int) -> list[str]:
+    keys = _IDX_KEYS
+    for i in range(len(keys), n):
+        keys.append(sys.intern(f"__idx_{i}"))
+    return keys
+
+
+def _props_equal(old: dict, new: dict) -> bool:
+    """Shallow props comparison used to skip ``memo`` components."""
+    if old is new:
+        return True
+    if len(old) != len(new):
+        return False
+    for k, v in new.items():
+        if k not in old:
+            return False
+        prev = old[k]
+        if prev is not v and prev != v:
+            return False
+    return True
+
 
 class HookContext:
+    __slots__ = (
+        "name",
+        "component_fn",
+        "props",
+        "key",
+        "hooks",
+        "effects",
+        "children",
+        "hook_idx",
+        "_ctx_subs",
+        "_effect_slots",
+        "_deps_cache",
+        "_debug_reasons",
+        "_mounted",
+        "_scheduled",
+        "__weakref__",  # contexts are tracked in WeakSets by use_context
+    )
+
     _services: Dict = {}
+    _services_lock = threading.RLock()  # factories may resolve other services
 
     @classmethod
     def get_service(cls, key, factory):
-        service = cls._services.get(key)
-        if service is None:
-            service = factory()
-            cls._services[key] = service
+        service = cls._services.get(key, _MISSING)
+        if service is _MISSING:
+            # Lock only on a miss so concurrent first calls build one instance
+            with cls._services_lock:
+                service = cls._services.get(key, _MISSING)
+                if service is _MISSING:
+                    service = factory()
+                    cls._services[key] = service
         return service
 
     def __init__(self, name, component_fn, *, props=None, key=None) -> None:
@@ -25,14 +78,44 @@ class HookContext:
         self.key = key
 
         self.hooks: list = []
-        self.effects: list = []
+        self.effects: dict = {}  # idx -> (effect_fn, deps_key), pending this render
         self.children: list["HookContext"] = []
         self.hook_idx: int = 0
         self._ctx_subs: list[WeakSet] = []
         self._effect_slots: set[int] = set()
+        self._deps_cache: dict = {}  # idx -> (deps list, deps tuple)
+        self._debug_reasons: list[str] = []
         self._mounted: bool = (
             True  # Track mount lifecycle to avoid rerenders after unmount
         )
+        self._scheduled: bool = False  # set by schedule_rerender until rendered
+
+    def _deps_key(self, idx, deps):
+        """Return ``deps`` as a tuple, reusing the last one if the same list is
+        passed again (like React, in-place mutation of deps is not observed)."""
+        if deps is None:
+            return None
+        cached = self._deps_cache.get(idx)
+        if cached is not None and cached[0] is deps:
+            return cached[1]
+        deps_key = tuple(deps)  # [] → () (immutable object)
+        self._deps_cache[idx] = (deps, deps_key)
+        return deps_key
+
+    def _schedule_update(self, reason_fn):
+        """Queue a rerender after a hook update, coalescing until the next render.
+
+        ``reason_fn`` builds the trace reason and is only called when tracing
+        is enabled; coalesced updates are still recorded in the trace.
+        """
+        if _debug.is_tracing_enabled():
+            reason = reason_fn()
+            if self._scheduled:
+                _debug.record_schedule(self, reason)
+            else:
+                schedule_rerender(self, reason=reason)
+        elif not self._scheduled:
+            schedule_rerender(self)
 
     def use_state(self, initial):
         idx = self.hook_idx
@@ -41,16 +124,14 @@ class HookContext:
 
         def set_state(val):
             nonlocal idx
-            if not getattr(
-                self, "_mounted", True
-            ):  # Ignore state updates after unmount
+            if not self._mounted:  # Ignore state updates after unmount
                 return
             if callable(val):
                 val = val(self.hooks[idx])
 
             if val != self.hooks[idx]:
                 self.hooks[idx] = val
-                schedule_rerender(self, reason=f"use_state[{idx}] set -> {val}")
+                self._schedule_update(lambda: f"use_state[{idx}] set -> {val}")
 
         self.hook_idx += 1
         return self.hooks[idx], set_state
@@ -63,8 +144,8 @@ class HookContext:
         - init_fn(optional): lazy initializer init_fn(initial) -> state
         - deps(optional): if provided, when changed, the state is REINITIALIZED with init_fn(initial) or initial.
         """
-        deps_key = None if deps is None else tuple(deps)  # [] → () (immutable object)
         idx = self.hook_idx
+        deps_key = self._deps_key(idx, deps)
 
         if idx >= len(self.hooks):  # first mount
             state0 = init_fn(initial) if init_fn is not None else initial
@@ -73,13 +154,15 @@ class HookContext:
             state, old_reducer, old_deps = self.hooks[idx]
 
             if (
-                deps_key is not None and old_deps != deps_key
+                deps_key is not None
+                and deps_key is not old_deps
+                and old_deps != deps_key
             ):  # Reinit due to deps change (optional)
                 state = init_fn(initial) if init_fn is not None else initial
                 self.hooks[idx] = (state, reducer, deps_key)
             else:
-                if (
-                    old_reducer is not reducer or old_deps != deps_key
+                if old_reducer is not reducer or (
+                    deps_key is not old_deps and old_deps != deps_key
                 ):  # Update reducer reference (dispatch uses the current reducer)
                     self.hooks[idx] = (
                         state,
@@ -90,46 +173,53 @@ class HookContext:
         def dispatch(action):
             nonlocal idx
             # Ignore dispatch after unmount
-            if not getattr(self, "_mounted", True):
+            if not self._mounted:
                 return
             s, r, dkey = self.hooks[idx]
             new_state = r(s, action)
             if new_state != s:
                 self.hooks[idx] = (new_state, r, dkey)
 
-                schedule_rerender(
-                    self, reason=f"use_reducer[{idx}] dispatch {action} -> {new_state}"
-                )
+                self._schedule_update(lambda: f"use_reducer[{idx}] dispatch {action} -> {new_state}")
 
         state, _r, _d = self.hooks[idx]
         self.hook_idx += 1
         return state, dispatch  # return the pair (state, dispatch)
 
     def use_effect(self, effect_fn, deps):
-        deps_key = None if deps is None else tuple(deps)  # [] → () (immutable object)
         idx = self.hook_idx
+        deps_key = self._deps_key(idx, deps)
 
         if idx >= len(self.hooks):  # first mount
-            self.hooks.append((None, deps_key))
-            self.effects.append((effect_fn, deps_key, idx))
+            # slot: (cleanup, deps_key, cleanup is a coroutine function)
+            self.hooks.append((None, deps_key, False))
+            self.effects[idx] = (effect_fn, deps_key)
             self._effect_slots.add(idx)
         else:  # updates
-            old_cleanup, old_deps = self.hooks[idx]
-            if deps_key is not None and old_deps != deps_key:  # deps changed
-                self.effects.append((effect_fn, deps_key, idx))
-                self.hooks[idx] = (old_cleanup, deps_key)
+            old_cleanup, old_deps, cleanup_async = self.hooks[idx]
+            if (
+                deps_key is not None
+                and deps_key is not old_deps  # identity first, then equality
+                and old_deps != deps_key
+            ):  # deps changed
+                self.effects[idx] = (effect_fn, deps_key)
+                self.hooks[idx] = (old_cleanup, deps_key, cleanup_async)
 
         self.hook_idx += 1
 
     def use_callback(self, fn, deps=None):
-        deps_key = None if deps is None else tuple(deps)  # [] -> () (immutable object)
         idx = self.hook_idx
+        deps_key = self._deps_key(idx, deps)
 
         if idx >= len(self.hooks):  # first time
             self.hooks.append((fn, deps_key))
         else:
             cached_fn, old_deps = self.hooks[idx]
-            if deps_key is not None and old_deps != deps_key:
+            if (
+                deps_key is not None
+                and deps_key is not old_deps
+                and old_deps != deps_key
+            ):
                 self.hooks[idx] = (fn, deps_key)  # deps changed -> new fn
             else:
                 fn = cached_fn  # use memo
@@ -138,14 +228,18 @@ class HookContext:
         return fn
 
     def use_memo(self, factory, deps=None):
-        deps_key = None if deps is None else tuple(deps)  # [] → () (immutable object)
         idx = self.hook_idx
+        deps_key = self._deps_key(idx, deps)
 
         if idx >= len(self.hooks):  # first time
             self.hooks.append((factory(), deps_key))
         else:
             value, old_key = self.hooks[idx]
-            if deps_key is not None and old_key != deps_key:
+            if (
+                deps_key is not None
+                and deps_key is not old_key
+                and old_key != deps_key
+            ):
                 value = factory()  # deps changed -> new value
                 self.hooks[idx] = (value, deps_key)
 
@@ -160,9 +254,7 @@ class HookContext:
             subscribe(self)
             subs_set = getattr(ctx_like, "_subs")
 
-            if subs_set not in self.__dict__.setdefault(
-                "_ctx_subs", []
-            ):  # keep reference to run on unmount
+            if subs_set not in self._ctx_subs:  # keep reference to run on unmount
                 self._ctx_subs.append(subs_set)
 
         idx = self.hook_idx
@@ -172,16 +264,16 @@ class HookContext:
             self.hooks.append(value)
         elif self.hooks[idx] != value:
             self.hooks[idx] = value
-            schedule_rerender(self, reason="use_context value changed")
+            self._schedule_update(lambda: "use_context value changed")
 
         self.hook_idx += 1
         return value
 
     def _run_cleanup_slot(self, slot):
-        cleanup = slot[0] if isinstance(slot, tuple) else None
+        cleanup, _, cleanup_async = slot
         if cleanup:
             try:
-                if asyncio.iscoroutinefunction(cleanup):
+                if cleanup_async:
                     asyncio.create_task(cleanup())
                 else:
                     cleanup()
@@ -189,16 +281,14 @@ class HookContext:
                 pass
 
     def unmount(self):
-        for idx in list(getattr(self, "_effect_slots", set())):
+        for idx in list(self._effect_slots):
             if idx < len(self.hooks):
                 self._run_cleanup_slot(self.hooks[idx])
 
         # 2. Remove Context subscriptions
-        for ws in getattr(self, "_ctx_subs", []):
+        for ws in self._ctx_subs:
             ws.discard(self)
-
-        if hasattr(self, "_ctx_subs"):
-            self._ctx_subs.clear()
+        self._ctx_subs.clear()
 
         # 3. Unmount children recursively
         for child in self.children:
@@ -208,115 +298,125 @@ class HookContext:
         self.children.clear()
         self.hooks.clear()
         self.effects.clear()
-        if hasattr(self, "_effect_slots"):
-            self._effect_slots.clear()
+        self._deps_cache.clear()
+        self._effect_slots.clear()
         # mark as unmounted to skip future rerenders
         self._mounted = False
 
-    def render(self):
-        import pyreact.core.core as core
+    def render(self) -> bool:
+        """Render this context and its changed children.
 
-        try:
-            from .debug import enter_render, exit_render
-        except Exception:
-
-            def enter_render(*_args, **_kw):  # type: ignore
-                return None
-
-            def exit_render(*_args, **_kw):  # type: ignore
-                return None
+        Returns ``True`` if any rendered context scheduled effects, i.e. when
+        :meth:`run_effects` has work to do.
+        """
+        import pyreact.core.core as core
 
         token = core._context_stack.set(self)
 
         try:
-            _depth_token = enter_render(self)
+            _depth_token = _debug.enter_render(self)
+            self._scheduled = False
             self.hook_idx = 0
-            self.effects = []
+            self.effects = {}
 
             # 1. store old children and start a new empty list
             old_children = self.children
-            self.children = []
+            children = self.children = []
+            children_append = children.append
 
             # 2. execute component function
-            output = self.component_fn(__internal=True, **self.props)
+            output = self.component_fn.raw(**self.props)
             vnodes = output if isinstance(output, list) else [output]
 
-            # 3. reconciliation – reuse or create child contexts
+            # positional keys for unkeyed children
+            idx_keys = _idx_keys(max(len(vnodes), len(old_children)))
+
+            # 3. index old children by (key or position, component) once;
+            #    duplicates can never be matched, so they are orphans already
+            old_by_key = {}
+            orphans = []
+            for i, c in enumerate(old_children):
+                k = (c.key if c.key is not None else idx_keys[i], c.component_fn)
+                if old_by_key.setdefault(k, c) is not c:
+                    orphans.append(c)
+
+            # 4. reconciliation – reuse or create child contexts
+            to_render = []
+            seen_unkeyed = set()  # component fns of unkeyed siblings so far
             for idx, vnode in enumerate(vnodes):
                 if not isinstance(vnode, VNode):
                     continue
 
-                vnode_key = vnode.key if vnode.key is not None else f"__idx_{idx}"
-
-                # 4. search for match in old_children
-                matched = next(
-                    (
-                        c
-                        for c in old_children
-                        if (
-                            c.key
-                            if c.key is not None
-                            else f"__idx_{old_children.index(c)}"
-                        )
-                        == vnode_key
-                        and c.component_fn is vnode.component_fn
-                    ),
-                    None,
+                vkey = vnode.key
+                vfn = vnode.component_fn
+                vprops = vnode.props
+                matched = old_by_key.pop(
+                    (vkey if vkey is not None else idx_keys[idx], vfn), None
                 )
 
                 # 5. warn if there are duplicate siblings without keys
-                if vnode.key is None:
-                    dup = any(
-                        (c.component_fn is vnode.component_fn and c.key is None)
-                        for c in self.children
-                    )
-                    if dup:
+                if vkey is None:
+                    if vfn in seen_unkeyed:
                         warnings.warn(
-                            f"\n\n⚠️ [HookContext] Sibling <{vnode.component_fn.__name__}> with no explicit 'key'; it can cause extra re-render.",
+                            f"\n\n⚠️ [HookContext] Sibling <{vfn.__name__}> with no explicit 'key'; it can cause extra re-render.",
                             RuntimeWarning,
                             stacklevel=2,
                         )
+                    seen_unkeyed.add(vfn)
 
                 if matched is None:
-                    matched = HookContext(
-                        vnode.component_fn.__name__,
-                        vnode.component_fn,
-                        props=vnode.props,
-                        key=vnode.key,
-                    )
+                    matched = HookContext(vfn.__name__, vfn, props=vprops, key=vkey)
+                elif (
+                    vfn.memo
+                    and not matched._scheduled
+                    and _props_equal(matched.props, vprops)
+                ):
+                    # memo component with unchanged props: keep its subtree as is
+                    children_append(matched)
+                    continue
                 else:
-                    matched.props = vnode.props
-
-                self.children.append(matched)
-
-            # 6. recursively unmount orphans
-            for orphan in old_children:
-                if orphan not in self.children:
-                    orphan.unmount()
-
-            # 7. recursively render current children
-            for child in self.children:
-                child.render()
+                    matched.props = vprops
+
+                children_append(matched)
+                to_render.append(matched)
+
+            # 6. recursively unmount orphans (old children left unmatched)
+            orphans.extend(old_by_key.values())
+            for orphan in orphans:
+                orphan.unmount()
+
+            # 7. recursively render current children (skipped memo ones excluded)
+            effects_pending = bool(self.effects)
+            for child in to_render:
+                if child.render():
+                    effects_pending = True
+            return effects_pending
         finally:
             try:
-                exit_render(_depth_token)
+                _debug.exit_render(_depth_token)
             except Exception:
                 pass
             # 8. restore previous component and original stack
             core._context_stack.reset(token)
 
     async def run_effects(self):
-        for fx, deps, idx in self.effects:
-            cln, _ = self.hooks[idx]
+        for idx, (fx, deps) in self.effects.items():
+            cln, _, cln_async = self.hooks[idx]
             if cln:
-                if asyncio.iscoroutinefunction(cln):
+                if cln_async:
                     await cln()
                 else:
                     cln()
             res = fx()
             if asyncio.iscoroutine(res):
                 res = await res
-            self.hooks[idx] = ((res if callable(res) else None), deps)
+            if callable(res):
+                self.hooks[idx] = (res, deps, asyncio.iscoroutinefunction(res))
+            else:
+                self.hooks[idx] = (None, deps, False)
+
+        # Effects ran; a child skipped by memo must not run them again
+        self.effects = {}
 
         for ch in self.children:
             await ch.run_effects()
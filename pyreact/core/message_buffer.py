@@ -1,6 +1,6 @@
 from collections import deque
-from threading import RLock
-from typing import Callable, Deque, List, Optional
+from threading import Lock
+from typing import Callable, Deque, Dict, Optional, Tuple
 
 
 class MessageBuffer:
@@ -27,8 +27,12 @@ class MessageBuffer:
 
         self._chunks: Deque[str] = deque()
         self._length: int = 0
-        self._subs: List[Callable[[str], None]] = []
-        self._lock: RLock = RLock()
+        self._dump_cache: Optional[str] = ""  # None when chunks changed since dump
+        # dict as an insertion-ordered set: O(1) subscribe/unsubscribe
+        self._subs: Dict[Callable[[str], None], None] = {}
+        # Immutable copy iterated by append(); rebuilt only on (un)subscribe
+        self._subs_snapshot: Tuple[Callable[[str], None], ...] = ()
+        self._lock: Lock = Lock()
 
         self._initialized = True
 
@@ -38,8 +42,9 @@ class MessageBuffer:
         with self._lock:
             self._chunks.append(text)
             self._length += len(text)
+            self._dump_cache = None
 
-        for cb in list(self._subs):
+        for cb in self._subs_snapshot:
             try:
                 cb(text)
             except Exception:
@@ -48,25 +53,29 @@ class MessageBuffer:
     # ---------------- Public API ----------------
     def dump(self) -> str:
         with self._lock:
-            return "".join(self._chunks)
+            if self._dump_cache is None:
+                # Repack into a single chunk so the next join only covers new text
+                self._dump_cache = "".join(self._chunks)
+                self._chunks.clear()
+                self._chunks.append(self._dump_cache)
+            return self._dump_cache
 
     def clear(self) -> None:
         with self._lock:
             self._chunks.clear()
             self._length = 0
+            self._dump_cache = ""
 
     def length(self) -> int:
-        with self._lock:
-            return self._length
+        # A single int read is atomic; no need to take the lock
+        return self._length
 
     def subscribe(self, cb: Callable[[str], None]) -> None:
         with self._lock:
-            if cb not in self._subs:
-                self._subs.append(cb)
+            self._subs[cb] = None
+            self._subs_snapshot = tuple(self._subs)
 
     def unsubscribe(self, cb: Callable[[str], None]) -> None:
         with self._lock:
-            try:
-                self._subs.remove(cb)
-            except ValueError:
-                pass
+            self._subs.pop(cb, None)
+            self._subs_snapshot = tuple(self._subs)
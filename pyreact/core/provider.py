@@ -1,31 +1,64 @@
 # provider.py ----------------------------------------------------
-from contextvars import ContextVar
 from functools import wraps
 from weakref import WeakSet
 from pyreact.core.core import component, hooks
 from pyreact.core.runtime import schedule_rerender
 
-# Global registry to prevent ContextVar instances from being garbage collected
+# Global registry to prevent context instances from being garbage collected
 _CONTEXT_REGISTRY = {}
 
+_MISSING = object()
+
+
+class _ContextValue:
+    """Plain value holder with the ``ContextVar`` get/set/reset API.
+
+    Renders and effects all run on the app's loop thread, so a ``ContextVar``
+    (and its per-set context copy) buys nothing here. ``set`` returns the
+    previous value as the token that ``reset`` restores.
+    """
+
+    __slots__ = ("name", "_value")
+
+    def __init__(self, name, *, default=None):
+        self.name = name
+        self._value = default
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        token = (self._value,)
+        self._value = value
+        return token
+
+    def reset(self, token):
+        self._value = token[0]
+
 
 def provider(ctx_var, *, prop="value"):
     def decorator(body_fn):
         @component
         @wraps(body_fn)
         def wrapper(*, key=None, **props):
-            try:
-                value = props.pop(prop)
-            except KeyError:
+            value = props.pop(prop, _MISSING)
+            if value is _MISSING:
                 raise TypeError(f"Provider missing required prop '{prop}'")
 
-            token = ctx_var.set(value)
+            # Only set (and allocate a token) when the value actually changes
+            current = ctx_var.get()
+            if current is not value and current != value:
+                token = ctx_var.set(value)
+            else:
+                token = None
 
-            def cleanup():
-                ctx_var.reset(token)
+            def _effect():
+                # register the cleanup – runs on the next commit or unmount
+                if token is None:
+                    return None
+                return lambda: ctx_var.reset(token)
 
-            # register the cleanup – runs on the next commit or unmount
-            hooks.use_effect(lambda: cleanup, [value])
+            hooks.use_effect(_effect, [value])
 
             return body_fn(**props)
 
@@ -36,12 +69,13 @@ def provider(ctx_var, *, prop="value"):
 
 def create_context(*, default=None, name="Context", prop="value"):
     # Check if context already exists in registry
-    context_key = f"{name}_{id(default) if default is not None else 'None'}"
+    context_key = (name, None if default is None else id(default))
     if context_key in _CONTEXT_REGISTRY:
         return _CONTEXT_REGISTRY[context_key]
 
-    ctx_var = ContextVar(name, default=default)
+    ctx_var = _ContextValue(name, default=default)
     subs_set = WeakSet()
+    set_reason = f"context {name} set"
 
     @provider(ctx_var, prop=prop)
     def _Provider(**props):
@@ -66,11 +100,17 @@ def create_context(*, default=None, name="Context", prop="value"):
 
         @staticmethod
         def set(value):
+            current = ctx_var.get()
+            if current is value or current == value:
+                return (current,)  # unchanged: nothing to notify, reset is a no-op
             token = ctx_var.set(value)
-            for hctx in list(subs_set):
+            if not subs_set:
+                return token
+            # schedule_rerender only enqueues, so subs_set cannot change under us
+            for hctx in subs_set:
                 try:
-                    schedule_rerender(hctx, reason=f"context {name} set")
-                except Exception:
+                    schedule_rerender(hctx, reason=set_reason)
+                except TypeError:
                     schedule_rerender(hctx)
             return token
 
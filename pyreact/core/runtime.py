@@ -1,22 +1,30 @@
 # runtime.py -------------------------------------------------
 import asyncio
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional
 
+from . import debug as _debug  # debug imports nothing from pyreact.core
 
-rerender_queue: asyncio.Queue = asyncio.Queue()
+# Only consumed synchronously by run_renders; wakeups go through _render_signal
+rerender_queue: Deque = deque()
 _enqueued: set = set()
 
-_render_idle: Optional[asyncio.Event] = None  # will be created on demand
-_render_signal: Optional[asyncio.Event] = None  # set when a render is scheduled
+# Contexts scheduled since the last drain; moved into rerender_queue by a single
+# loop callback per burst instead of one call_soon_threadsafe per context.
+_pending: Deque = deque()
+_drain_scheduled: bool = False
+
+# Loop that runs run_renders(); schedules from any other thread/loop go through it
+_render_loop: Optional[asyncio.AbstractEventLoop] = None
 
+_render_signal: Optional[asyncio.Event] = None  # set when a render is scheduled
 
-def get_render_idle() -> asyncio.Event:
-    """Ensure the ``Event`` belongs to the currently running loop."""
-    global _render_idle
-    if _render_idle is None:
-        _render_idle = asyncio.Event()
-        _render_idle.set()  # start in the 'idle' state
-    return _render_idle
+# Idle tracking without a second Event: each queued context bumps _render_gen,
+# and a batch marks every generation queued before it started as drained.
+# Futures are only created when someone waits.
+_render_gen: int = 0  # bumped whenever a context is queued
+_drained_gen: int = 0  # every generation up to this one has been rendered
+_idle_waiters: list = []
 
 
 def get_render_signal() -> asyncio.Event:
@@ -27,57 +35,108 @@ def get_render_signal() -> asyncio.Event:
     return _render_signal
 
 
+async def wait_render_idle() -> None:
+    """Wait until every rerender scheduled before the call has been rendered.
+
+    Renders scheduled later (e.g. by effects of those renders) are not waited
+    for, so a tree that keeps scheduling itself cannot block the caller.
+    """
+    target = _render_gen
+    while _drained_gen < target:
+        fut = asyncio.get_running_loop().create_future()
+        _idle_waiters.append(fut)
+        await fut
+
+
 def schedule_rerender(ctx, reason: str = None):
+    global _render_gen, _drain_scheduled
     # Record schedule intent for debug tooling
     try:
-        from .debug import record_schedule  # local import to avoid cycles
-
-        record_schedule(ctx, reason)
+        _debug.record_schedule(ctx, reason)
     except Exception:
         pass
-    loop = asyncio.get_running_loop()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    render_loop = _render_loop
+    if loop is None and render_loop is None:
+        raise RuntimeError("schedule_rerender() needs a running render loop")
+
+    ctx._scheduled = True  # cleared when ctx renders
     if ctx in _enqueued:
         return
     _enqueued.add(ctx)
+    _render_gen += 1
+
+    # Common case: already on the render loop, so enqueue directly
+    if loop is not None and (loop is render_loop or render_loop is None):
+        rerender_queue.append(ctx)
+        get_render_signal().set()
+        return
+
+    # Foreign thread or loop: hand off to the render loop in one drain per burst
+    _pending.append(ctx)
+    if not _drain_scheduled:
+        _drain_scheduled = True
+        (render_loop or loop).call_soon_threadsafe(_drain_pending)
 
-    def _enqueue():
-        try:
-            rerender_queue.put_nowait(ctx)
-        finally:
-            get_render_signal().set()  # Set the signal only after the ctx is in the queue to avoid races
 
-    loop.call_soon_threadsafe(_enqueue)
+def _drain_pending() -> None:
+    global _drain_scheduled
+    # Re-arm before draining so a context appended meanwhile schedules a new drain
+    _drain_scheduled = False
+    try:
+        while _pending:
+            rerender_queue.append(_pending.popleft())
+    finally:
+        get_render_signal().set()  # Set the signal only after the ctx is in the queue to avoid races
 
 
-async def run_renders() -> None:
+async def run_renders() -> bool:
+    """Drain the rerender queue.
+
+    Returns ``True`` when more renders were scheduled while this batch ran, so
+    the caller can yield with ``asyncio.sleep(0)`` instead of waiting a frame.
+    """
     from pyreact.core.hook import HookContext  # import here to avoid infinite loop
-    from .debug import start_trace, end_trace
 
-    while True:
-        try:
-            ctx: HookContext = rerender_queue.get_nowait()
-        except Exception:
-            break
+    global _render_loop, _drained_gen
+    _render_loop = asyncio.get_running_loop()
+
+    # Pull in cross-thread schedules so this batch covers every generation so far
+    if _pending:
+        _drain_pending()
+    batch_gen = _render_gen
+
+    # Only render what is queued now; contexts scheduled while rendering are
+    # picked up by the next call, so a self-rescheduling effect cannot spin here
+    for _ in range(len(rerender_queue)):
+        ctx: HookContext = rerender_queue.popleft()
         _enqueued.discard(ctx)
-        if getattr(ctx, "_mounted", True):
-            reasons = getattr(ctx, "_debug_reasons", [])
+        if ctx._mounted:  # HookContext slots: always present
             try:
-                start_trace(ctx, reasons)
+                _debug.start_trace(ctx, ctx._debug_reasons)
             except Exception:
                 pass
             # Clear reasons once consumed
+            ctx._debug_reasons = []
+            if ctx.render():  # no effects scheduled → skip the effects walk
+                await ctx.run_effects()
             try:
-                ctx._debug_reasons = []
-            except Exception:
-                pass
-            ctx.render()
-            await ctx.run_effects()
-            try:
-                end_trace()
+                _debug.end_trace()
             except Exception:
                 pass
 
-    # Mark idle and clear signal after draining current batch
-    if rerender_queue.empty():
-        get_render_idle().set()
+    # Clear the signal after draining the current batch
+    if not rerender_queue:
         get_render_signal().clear()
+    if batch_gen > _drained_gen:
+        # Everything queued before this batch has rendered: wake waiters
+        _drained_gen = batch_gen
+        if _idle_waiters:
+            for fut in _idle_waiters:
+                if not fut.done():
+                    fut.set_result(None)
+            _idle_waiters.clear()
+    return bool(_enqueued)
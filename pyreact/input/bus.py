@@ -1,3 +1,4 @@
+from threading import Lock
 from typing import Callable, TypedDict, Literal
 
 
@@ -9,28 +10,36 @@ class Event(TypedDict, total=False):
 
 
 Subscriber = Callable[[Event], None]
+Unsubscribe = Callable[[], None]
 
 
 class InputBus:
     """Input bus (thread-safe enough for use with ``asyncio``)."""
 
     def __init__(self):
-        self._subs: list[Subscriber] = []
-
-    def subscribe(self, fn: Subscriber):
-        if fn not in self._subs:
-            self._subs.append(fn)
+        # Insertion-ordered index: O(1) (un)subscribe without reordering
+        self._subs_index: dict[Subscriber, None] = {}
+        # Immutable copy iterated by emit(); rebuilt only on (un)subscribe
+        self._subs: tuple[Subscriber, ...] = ()
+        self._lock = Lock()
+
+    def subscribe(self, fn: Subscriber) -> Unsubscribe:
+        """Register ``fn`` and return a callable that removes it again."""
+        with self._lock:
+            if fn not in self._subs_index:
+                self._subs_index[fn] = None
+                self._subs = tuple(self._subs_index)
 
         def unsubscribe():
-            try:
-                self._subs.remove(fn)
-            except ValueError:
-                pass
+            with self._lock:
+                if fn in self._subs_index:
+                    del self._subs_index[fn]
+                    self._subs = tuple(self._subs_index)
 
         return unsubscribe
 
     def emit(self, ev: Event) -> None:
-        for fn in list(self._subs):
+        for fn in self._subs:  # read-only: never written back from here
             try:
                 fn(ev)
             except Exception:
@@ -1,9 +1,11 @@
 import asyncio
 import time
 from typing import Optional, Callable, Dict
-from pyreact.core.runtime import get_render_idle
+from pyreact.core.runtime import wait_render_idle
 from pyreact.input.bus import InputBus
 
+_QUIT_COMMANDS = frozenset(("quit", "exit", "q"))
+
 
 def _emit_text_submit(bus: InputBus, txt: str):
     now = time.time()
@@ -45,7 +47,7 @@ class TerminalInput:
                     cmd = ""
                     args_str = ""
                 # Built-in quit/exit commands
-                if cmd in ("quit", "exit", "q"):
+                if cmd in _QUIT_COMMANDS:
                     self._stopping = True
                     break
                 fn = self._commands.get(cmd)
@@ -59,8 +61,7 @@ class TerminalInput:
                     continue
             _emit_text_submit(self.bus, txt)
 
-            await asyncio.sleep(0.1)
-            await get_render_idle().wait()
+            await wait_render_idle()
 
     def start(self):
         if self._task is None:
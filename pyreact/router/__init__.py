@@ -2,6 +2,7 @@
 from .router import Router, use_route, use_routes_catalog
 from .route import (
     Route,
+    RouteParamsContext,
     use_route_params,
     use_query_params,
     use_navigate,
@@ -12,6 +13,7 @@ __all__ = [
     "use_route",
     "use_routes_catalog",
     "Route",
+    "RouteParamsContext",
     "use_route_params",
     "use_query_params",
     "use_navigate",
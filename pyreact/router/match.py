@@ -1,33 +1,34 @@
 import re
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+# ':name' param | trailing '*' | run of literal text | stray '*'
+_TOKEN_RE = re.compile(r":(\w*)|(\*\Z)|([^:*]+|\*)")
+
+
+def _token_to_regex(m: "re.Match[str]") -> str:
+    literal = m.group(3)
+    if literal is not None:
+        return re.escape(literal)
+    if m.group(2) is not None:
+        return "(?P<splat>.*)"
+    return f"(?P<{m.group(1) or 'param'}>[^/]+)"
 
 
 def _to_regex(pat: str, exact_local: bool):
-    tokens = []
-    i = 0
-    while i < len(pat):
-        c = pat[i]
-        if c == ":":
-            j = i + 1
-            while j < len(pat) and (pat[j].isalnum() or pat[j] == "_"):
-                j += 1
-            name = pat[i + 1 : j] or "param"
-            tokens.append(f"(?P<{name}>[^/]+)")
-            i = j
-        elif c == "*" and i == len(pat) - 1:
-            tokens.append("(?P<splat>.*)")
-            i += 1
-        else:
-            tokens.append(re.escape(c))
-            i += 1
-    body = "".join(tokens)
+    body = _TOKEN_RE.sub(_token_to_regex, pat)
     anchor = "^" + body + ("$" if exact_local else "")
     return re.compile(anchor)
 
 
+@lru_cache(maxsize=512)
 def compile_route_pattern(path_pattern: str, exact: bool):
     """Compile a route path pattern into a regex pattern.
 
+    Results are cached per ``(path_pattern, exact)``: route patterns are a small
+    fixed set, so every later lookup is a cache hit.
+
     Rules:
     - If pattern starts with '^' → treat as explicit regex (re.compile as-is)
     - If pattern ends with '/*' → prefix match (non-exact)
@@ -42,13 +43,112 @@ def compile_route_pattern(path_pattern: str, exact: bool):
     return _to_regex(path_pattern, exact_local=exact)
 
 
+@lru_cache(maxsize=512)
+def compile_route_matcher(path_pattern: str, exact: bool):
+    """Return ``(match, has_groups)`` for a route pattern.
+
+    ``match`` is a ``pathname -> Match | None`` callable: exact, non-regex
+    patterns are compiled without the ``$`` anchor and use ``fullmatch``;
+    everything else uses ``compile_route_pattern().match``. ``has_groups`` is
+    False when the pattern has no named groups, so callers can skip
+    ``groupdict()``.
+    """
+    if exact and not path_pattern.startswith("^") and not path_pattern.endswith("/*"):
+        rx = _to_regex(path_pattern, exact_local=False)
+        return rx.fullmatch, bool(rx.groupindex)
+    rx = compile_route_pattern(path_pattern, exact)
+    return rx.match, bool(rx.groupindex)
+
+
+def is_static_pattern(path_pattern: str) -> bool:
+    """True for literal paths (no regex, ``:param`` or ``*``): exact routes with
+    such a pattern match by string equality alone."""
+    return (
+        not path_pattern.startswith("^")
+        and ":" not in path_pattern
+        and "*" not in path_pattern
+    )
+
+
+_GROUP_NAME_RE = re.compile(r"\(\?P([<=])(\w+)")
+# Numbered backreferences and conditionals refer to absolute group numbers,
+# which shift once the route is embedded in the fused alternation.
+_GROUP_NUMBER_REF_RE = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+@lru_cache(maxsize=64)
+def compile_route_table(patterns: Tuple[Tuple[str, bool], ...]):
+    """Fuse ``(path_pattern, exact)`` pairs into a single alternation regex.
+
+    Each route becomes one top-level group, with its named groups prefixed by
+    ``r<N>_`` so names cannot collide. Alternatives are tried in order, so the
+    first matching route wins exactly as with a linear scan.
+
+    Returns ``(rx, route_by_group, static)``: ``route_by_group`` maps each
+    route's group index to its position in ``patterns`` and ``static`` maps
+    literal paths to their route when no earlier route could match first.
+    Returns ``None`` when the patterns cannot be fused (e.g. an explicit regex
+    with inline flags or numbered backreferences); callers then match route
+    by route.
+    """
+    parts: List[str] = []
+    route_by_group: Dict[int, int] = {}
+    static: Dict[str, int] = {}
+    only_static = True  # every route so far is exact and literal
+    group = 1
+    for i, (path_pattern, exact) in enumerate(patterns):
+        if only_static and exact and is_static_pattern(path_pattern):
+            static.setdefault(path_pattern, i)
+        else:
+            only_static = False
+        rx = compile_route_pattern(path_pattern, exact)
+        if _GROUP_NUMBER_REF_RE.search(rx.pattern):
+            return None
+        body = _GROUP_NAME_RE.sub(rf"(?P\1r{i}_\2", rx.pattern)
+        parts.append(f"({body})")
+        route_by_group[group] = i
+        group += rx.groups + 1
+    try:
+        fused = re.compile("|".join(parts))
+    except re.error:
+        return None
+    return fused, route_by_group, static
+
+
+def match_route_table(
+    table, pathname: str
+) -> Optional[Tuple[int, Dict[str, str]]]:
+    """Match ``pathname`` against a table from :func:`compile_route_table`.
+
+    Returns ``(route_index, params)`` for the first matching route, else None.
+    """
+    rx, route_by_group, static = table
+    idx = static.get(pathname)
+    if idx is not None:  # literal route: one dict probe, no regex
+        return idx, {}
+    m = rx.match(pathname)
+    if m is None:
+        return None
+    # The route's own group closes last, so lastindex identifies the route
+    idx = route_by_group[m.lastindex]
+    prefix = f"r{idx}_"
+    params = {
+        k[len(prefix) :]: v
+        for k, v in m.groupdict().items()
+        if k.startswith(prefix)
+    }
+    return idx, params
+
+
 def match_path(
     path_pattern: str, pathname: str, exact: bool
 ) -> Tuple[bool, Dict[str, str]]:
     """Match a pathname against a route pattern and return (ok, params)."""
-    rx = compile_route_pattern(path_pattern, exact)
-    m = rx.match(pathname)
-    return (m is not None, m.groupdict() if m else {})
+    match, has_groups = compile_route_matcher(path_pattern, exact)
+    m = match(pathname)
+    if m is None:
+        return (False, {})
+    return (True, m.groupdict() if has_groups else {})
 
 
 def matches(path_pattern: str, pathname: str, exact: bool) -> bool:
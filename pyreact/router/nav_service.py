@@ -1,6 +1,7 @@
+import warnings
 from dataclasses import dataclass, field
 from typing import Callable, NotRequired, Optional, Dict, Union, TypeAlias, TypedDict
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import SplitResult, parse_qs, urlsplit
 
 ParamValue: TypeAlias = Union[str, int, float, bool]
 QueryValue: TypeAlias = Union[str, int, float, bool]
@@ -24,12 +25,75 @@ NavigateFn: TypeAlias = Callable[
 ]
 
 
+class _Subscribers(list):
+    """Subscriber list that keeps an immutable snapshot for ``commit``.
+
+    Subscribing/unsubscribing (on mount/unmount) rebuilds ``snapshot`` and the
+    ``members`` set, so a navigation iterates the snapshot without copying and
+    checks for mid-walk removals in O(1).
+    """
+
+    __slots__ = ("snapshot", "members")
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        self.snapshot = tuple(self)
+        self.members = set(self.snapshot)
+
+
+def _refreshing(name: str):
+    base = getattr(list, name)
+
+    def method(self, *args):
+        result = base(self, *args)
+        self._refresh()
+        return result
+
+    method.__name__ = name
+    return method
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(_Subscribers, _name, _refreshing(_name))
+
+
 @dataclass
 class NavService:
-    subs: list[Callable[[str], None]] = field(default_factory=list)
+    subs: list[Callable[[str], None]] = field(default_factory=_Subscribers)
     navigate: Optional["NavigateFn"] = None
     current: str = "/"
 
+    # Parse cache for ``current``, refreshed when the URL object changes
+    _parsed_url: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _parsed: Optional[SplitResult] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _query: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.subs, _Subscribers):
+            self.subs = _Subscribers(self.subs)
+
     def __getitem__(self, key):
         return getattr(self, key)
 
@@ -39,30 +103,52 @@ class NavService:
     def get(self, key, default=None):
         return getattr(self, key, default)
 
-    def get_query_params(self) -> Dict[str, str]:
-        """Get query parameters from current URL"""
-        parsed = urlparse(self.current)
-        query_params = {}
+    def _split(self) -> SplitResult:
+        url = self.current
+        if url is not self._parsed_url:
+            self._parsed = urlsplit(url)
+            self._query = None
+            self._parsed_url = url
+        return self._parsed
 
-        for key, values in parse_qs(parsed.query).items():
-            query_params[key] = values[0] if values else ""
+    def get_query_params(self) -> Dict[str, str]:
+        """Get query parameters from current URL (cached; do not mutate)"""
+        parsed = self._split()
+        query_params = self._query
+        if query_params is None:
+            query_params = {}
+            for key, values in parse_qs(parsed.query).items():
+                query_params[key] = values[0] if values else ""
+            self._query = query_params
 
         return query_params
 
     def get_fragment(self) -> str:
         """Get fragment/hash from current URL"""
-        parsed = urlparse(self.current)
-        return parsed.fragment
+        return self._split().fragment
 
     def get_path(self) -> str:
         """Get path portion of current URL (without query or fragment)"""
-        parsed = urlparse(self.current)
-        return parsed.path
+        return self._split().path
+
+    def navigate_live(self, *args, **kwargs) -> None:
+        """Forward to the ``navigate`` installed by the mounted Router."""
+        svc_nav: Optional[NavigateFn] = self.navigate
+        if callable(svc_nav):
+            return svc_nav(*args, **kwargs)
+        warnings.warn("navigate called before Router mounted")
+        return None
 
     def commit(self, final_url: str) -> None:
         """Set current URL and notify subscribers."""
         self.current = final_url
-        for fn in list(self.subs):
+        # Notify the subscribers present now; ones added during the walk wait
+        # for the next commit, ones removed during it are skipped
+        subs = self.subs
+        snapshot = subs.snapshot
+        for fn in snapshot:
+            if subs.snapshot is not snapshot and fn not in subs.members:
+                continue
             try:
                 fn(final_url)
             except Exception:
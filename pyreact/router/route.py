@@ -3,8 +3,8 @@ from typing import Dict, List, Optional, Any
 from pyreact.core.core import component, hooks
 from pyreact.core.provider import create_context
 from .nav_service import NavService
-from .router import use_route  # function that reads RouterContext
-from .match import compile_route_pattern
+from .router import use_route  # use_route reads RouterContext
+from .match import compile_route_matcher, is_static_pattern
 
 RouteParamsContext = create_context(default={}, name="RouteParams")
 
@@ -49,29 +49,32 @@ def Route(
     - ``utterances``: common expressions to map free text.
     - ``default_params``: default parameters if the route is parameterized.
     """
-    current_full, _ = use_route()  # e.g. '/about?search=test'
-    # Use only the path portion for route matching (without query params)
-    current = current_full.split("?")[0]
+    use_route()  # subscribe to path changes
+    # Match against the path only (NavService caches the parsed URL)
+    navsvc = hooks.get_service("nav_service", NavService)
+    current = navsvc.get_path()
 
     # Router now selects the single matching Route VNode; this component
     # only needs to inject params and render children when matched.
 
-    def build_matcher():
-        rx = compile_route_pattern(path, exact)
-
-        def match(s: str):
-            m = rx.match(s)
-            return (m is not None, m.groupdict() if m else {})
-
-        return match
-
-    matcher = hooks.use_memo(build_matcher, [path, exact])
-
-    ok, params = matcher(current)
-
-    # If this route doesn't match, return empty
-    if not ok:
-        return []
+    if exact and is_static_pattern(path):
+        # Literal path: plain string comparison, no regex
+        if current != path:
+            return []
+        params = {}
+    else:
+        # compile_route_matcher is cached, so this is a lookup, not a compile
+        match, has_groups = compile_route_matcher(path, exact)
+        m = match(current)
+
+        # If this route doesn't match, return empty
+        if m is None:
+            return []
+        params = m.groupdict() if has_groups else {}
 
     # pass params to children (if any)
     return [RouteParamsContext(value=params, children=children)]
+
+
+# Lets Router recognise Route children without importing this module
+Route.is_route = True
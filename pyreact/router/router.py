@@ -1,10 +1,10 @@
+import re
 from typing import (
     Dict,
     Optional,
     Union,
 )
-from urllib.parse import urlencode, urlparse, urlunparse
-import warnings
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 from pyreact.core.core import component, hooks
 from pyreact.core.provider import create_context
 from .nav_service import (
@@ -14,7 +14,7 @@ from .nav_service import (
     ParamValue,
     QueryValue,
 )
-from .match import matches as route_matches
+from .match import compile_route_table, match_route_table, matches as route_matches
 
 
 RouteContext = create_context(default="/", name="Route")
@@ -25,28 +25,57 @@ def use_routes_catalog():
     return hooks.use_context(RoutesCatalogContext)
 
 
+_PARAM_SUB_RE = re.compile(r":(\w+)")
+
+
+def _merge_query(embedded: str, query: Dict[str, str]) -> str:
+    """Overlay ``query`` on an embedded query string, key by key."""
+    merged = dict(parse_qsl(embedded, keep_blank_values=True))
+    merged.update(query)
+    return urlencode(merged)
+
+
 def _build_url(
     path: str,
     params: Optional[Dict[str, ParamValue]] = None,
     query: Optional[Dict[str, QueryValue]] = None,  # noqa: F821
     fragment: str = "",
 ) -> str:
-    """Build a URL with path parameters and query string"""
-    # Replace path parameters like :id with actual values
+    """Build a URL with path parameters and query string.
+
+    A query or fragment already written into ``path`` is kept: ``query`` is
+    merged into the embedded query by key (``query`` wins), and a non-empty
+    ``fragment`` replaces the embedded one.
+    """
+    # Replace path parameters like :id with actual values in a single scan
     if params:
-        for key, value in params.items():
-            path = path.replace(f":{key}", str(value))
+        path = _PARAM_SUB_RE.sub(
+            lambda m: str(params[m.group(1)]) if m.group(1) in params else m.group(0),
+            path,
+        )
 
-    # Build query string
-    query_string = ""
+    # Filter out None values and convert everything to strings
+    clean_query = {}
     if query:
-        # Filter out None values and convert everything to strings
         clean_query = {k: str(v) for k, v in query.items() if v is not None}
+
+    # Root-relative path (the common case): plain string operations
+    if path.startswith("/") and not path.startswith("//"):
+        result, sep, embedded_fragment = path.partition("#")
         if clean_query:
-            query_string = urlencode(clean_query)
+            result, _, embedded_query = result.partition("?")
+            result += "?" + _merge_query(embedded_query, clean_query)
+        if fragment:
+            result += "#" + fragment
+        elif sep:
+            result += sep + embedded_fragment
+        return result
 
     # Combine everything
     parsed = urlparse(path)
+    query_string = parsed.query
+    if clean_query:
+        query_string = _merge_query(query_string, clean_query)
     result = urlunparse(
         (
             parsed.scheme,
@@ -54,27 +83,53 @@ def _build_url(
             parsed.path,
             parsed.params,
             query_string,
-            fragment,
+            fragment or parsed.fragment,
         )
     )
 
     return result
 
 
+def _build_router_tables(children):
+    """Collect Route children, their fused match table and the routes catalog
+    in a single pass over ``children``."""
+    route_children = []
+    route_patterns = []
+    routes_catalog = []
+    for ch in children:
+        # VNode has attribute 'component_fn' and 'props'; Route is tagged is_route
+        component_fn = getattr(ch, "component_fn", None)
+        if not getattr(component_fn, "is_route", False):
+            continue
+        props = ch.props
+        path_pattern = props.get("path", "/")
+        exact = props.get("exact", True)
+        route_children.append(ch)
+        route_patterns.append((path_pattern, exact))
+        # Optional human-friendly name if provided alongside Route props
+        name = props.get("name", props.get("title", props.get("key", path_pattern)))
+        routes_catalog.append(
+            {
+                "path": path_pattern,
+                "exact": exact,
+                "name": name,
+                "description": props.get("description"),
+                "utterances": props.get("utterances") or [],
+                "params": props.get("default_params"),
+            }
+        )
+    # compile_route_table is cached per pattern set
+    table = compile_route_table(tuple(route_patterns))
+    return route_children, table, route_patterns, routes_catalog
+
+
 def use_route():
     # Subscribe to current path changes via RouteContext
     current = hooks.use_context(RouteContext)
-    # Navigate comes from the NavService (set by Router on mount)
+    # Navigate comes from the NavService (set by Router on mount); the bound
+    # method compares equal across renders, so it is safe in deps lists
     navsvc = hooks.get_service("nav_service", NavService)
-
-    def _navigate_live(*args, **kwargs) -> NavigateFn:
-        svc_nav: NavigateFn = getattr(navsvc, "navigate", None)
-        if callable(svc_nav):
-            return svc_nav(*args, **kwargs)
-        warnings.warn("navigate called before Router mounted")
-        return None
-
-    return current, _navigate_live
+    return current, navsvc.navigate_live
 
 
 @component
@@ -84,10 +139,11 @@ def Router(*, initial=None, children):
         initial = navsvc.current
 
     # Force Router to rerender on nav changes so selected Route updates
-    _version, _set_version = hooks.use_state(0)
+    # (keyed on the URL, so re-navigating to the current URL is a no-op)
+    _url, _set_url = hooks.use_state(navsvc.current)
 
-    def _on_nav(_):
-        _set_version(lambda v: v + 1)
+    def _on_nav(url):
+        _set_url(url)
 
     _nav_handler = hooks.use_memo(lambda: _on_nav, [])
 
@@ -132,7 +188,11 @@ def Router(*, initial=None, children):
             else:
                 path_str = new_path
 
-            final_url = _build_url(path_str, params, query, fragment)
+            if params or query or fragment:
+                final_url = _build_url(path_str, params, query, fragment)
+            else:
+                # Plain path: nothing to build (same result as _build_url)
+                final_url = path_str
             # Update RouteContext and notify subscribers
             RouteContext.set(final_url)
             # Commit and notify NavService subscribers (e.g., Router, server)
@@ -146,51 +206,26 @@ def Router(*, initial=None, children):
     # Use the CURRENT path from the service
     current_path_only = navsvc.current
 
-    current_path_for_match = current_path_only.split("?")[0]
+    current_path_for_match = navsvc.get_path()
 
-    selected_child = None
-    for ch in children:
-        # VNode has attribute 'component_fn' and 'props'
-        component_fn = getattr(ch, "component_fn", None)
-        props = getattr(ch, "props", None)
-        if component_fn is None or props is None:
-            continue
-        if getattr(component_fn, "__name__", "") != "Route":
-            continue
-        path_pattern = props.get("path", "/")
-        exact = props.get("exact", True)
-        if route_matches(path_pattern, current_path_for_match, exact):
-            selected_child = ch
-            break
-
-    selected_children = [] if selected_child is None else [selected_child]
+    route_children, table, route_patterns, routes_catalog = hooks.use_memo(
+        lambda: _build_router_tables(children), [children]
+    )
 
-    # Build a catalog of all declared routes to expose via context
-    routes_catalog = []
-    for ch in children:
-        component_fn = getattr(ch, "component_fn", None)
-        props = getattr(ch, "props", None)
-        if component_fn is None or props is None:
-            continue
-        if getattr(component_fn, "__name__", "") != "Route":
-            continue
-        path_pattern = props.get("path", "/")
-        exact = props.get("exact", True)
-        # Optional human-friendly name if provided alongside Route props
-        name = props.get("name", props.get("title", props.get("key", path_pattern)))
-        description = props.get("description")
-        utterances = props.get("utterances") or []
-        default_params = props.get("default_params")
-        routes_catalog.append(
-            {
-                "path": path_pattern,
-                "exact": exact,
-                "name": name,
-                "description": description,
-                "utterances": utterances,
-                "params": default_params,
-            }
-        )
+    def _select_children():
+        # One fused regex match picks the first matching Route
+        if table is not None:
+            hit = match_route_table(table, current_path_for_match)
+            return [] if hit is None else [route_children[hit[0]]]
+        for ch, (path_pattern, exact) in zip(route_children, route_patterns):
+            if route_matches(path_pattern, current_path_for_match, exact):
+                return [ch]
+        return []
+
+    # Query/fragment-only navigations keep the same path: reuse the selection
+    selected_children = hooks.use_memo(
+        _select_children, [route_children, current_path_for_match]
+    )
 
     return [
         RouteContext(
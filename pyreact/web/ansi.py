@@ -1,15 +1,41 @@
 from __future__ import annotations
 
-import html
 import re
-from typing import Dict
+from functools import lru_cache
 
 
-_SGR_RE = re.compile(r"\x1b\[(?P<codes>[0-9;]*)m")
+# An SGR sequence, or a run of text (a lone ESC that starts no SGR is text too)
+# re.ASCII: the patterns only name ASCII characters, skip Unicode handling
+_TOKEN_RE = re.compile(
+    r"\x1b\[(?P<codes>[0-9;]*)m|(?P<text>[^\x1b]+|\x1b)", re.ASCII
+)
+_UNSAFE_RE = re.compile(r"[<>&\"']", re.ASCII)
+# Same replacements as html.escape(quote=True), applied in a single pass
+_HTML_ESCAPE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
 
 
-def _style_from_codes(codes: str, state: Dict[str, object]) -> Dict[str, object]:
-    # Mutates and returns state
+def _escape(text: str) -> str:
+    # Most console text has nothing to escape: return it as is
+    if _UNSAFE_RE.search(text) is None:
+        return text
+    return text.translate(_HTML_ESCAPE)
+
+
+# Style state packed into an int: fg code << 16 | bg code << 8 | flag bits
+# (0 = no fg/bg, 0 overall = unstyled), so it can key the caches below.
+_BOLD = 1
+_DIM = 2
+_ITALIC = 4
+_UNDERLINE = 8
+_FG_MASK = 0xFF << 16
+_BG_MASK = 0xFF << 8
+
+
+@lru_cache(maxsize=1024)
+def _apply_codes(state: int, codes: str) -> int:
+    """Return the state after applying an SGR parameter string to ``state``."""
     if not codes:
         codes_list = [0]
     else:
@@ -17,41 +43,36 @@ def _style_from_codes(codes: str, state: Dict[str, object]) -> Dict[str, object]
 
     for code in codes_list:
         if code == 0:  # reset
-            state.clear()
+            state = 0
             continue
 
         # intensity / decorations
         if code == 1:
-            state["bold"] = True
+            state |= _BOLD
         elif code == 2:
-            state["dim"] = True
+            state |= _DIM
         elif code == 22:
-            state.pop("bold", None)
-            state.pop("dim", None)
+            state &= ~(_BOLD | _DIM)
         elif code == 3:
-            state["italic"] = True
+            state |= _ITALIC
         elif code == 23:
-            state.pop("italic", None)
+            state &= ~_ITALIC
         elif code == 4:
-            state["underline"] = True
+            state |= _UNDERLINE
         elif code == 24:
-            state.pop("underline", None)
+            state &= ~_UNDERLINE
 
         # foreground
         elif code == 39:
-            state.pop("fg", None)
-        elif 30 <= code <= 37:
-            state["fg"] = code
-        elif 90 <= code <= 97:
-            state["fg"] = code
+            state &= ~_FG_MASK
+        elif 30 <= code <= 37 or 90 <= code <= 97:
+            state = (state & ~_FG_MASK) | (code << 16)
 
         # background
         elif code == 49:
-            state.pop("bg", None)
-        elif 40 <= code <= 47:
-            state["bg"] = code
-        elif 100 <= code <= 107:
-            state["bg"] = code
+            state &= ~_BG_MASK
+        elif 40 <= code <= 47 or 100 <= code <= 107:
+            state = (state & ~_BG_MASK) | (code << 8)
 
     return state
 
@@ -75,46 +96,27 @@ _COLOR_MAP = {
     97: "#f3f4f6",  # gray-100
 }
 
-_BGCOLOR_FROM_FG = {
-    40: 30,
-    41: 31,
-    42: 32,
-    43: 33,
-    44: 34,
-    45: 35,
-    46: 36,
-    47: 37,
-    100: 90,
-    101: 91,
-    102: 92,
-    103: 93,
-    104: 94,
-    105: 95,
-    106: 96,
-    107: 97,
-}
+# Indexed directly by SGR code; a background code is its foreground code + 10
+_COLOR_TUPLE = tuple(_COLOR_MAP.get(i) for i in range(108))
 
 
-def _css_from_state(state: Dict[str, object]) -> str:
+@lru_cache(maxsize=None)  # bounded: only a few thousand reachable states
+def _css_from_state(state: int) -> str:
     css: list[str] = []
-    fg = state.get("fg")
-    bg = state.get("bg")
-    if isinstance(fg, int):
-        col = _COLOR_MAP.get(fg)
-        if col:
-            css.append(f"color:{col}")
-    if isinstance(bg, int):
-        fg_equiv = _BGCOLOR_FROM_FG.get(bg)
-        col = _COLOR_MAP.get(fg_equiv) if fg_equiv is not None else None
-        if col:
-            css.append(f"background-color:{col}")
-    if state.get("bold"):
+    fg = state >> 16
+    bg = (state >> 8) & 0xFF
+    # fg/bg only ever hold codes from the palette ranges (see _apply_codes)
+    if fg:
+        css.append(f"color:{_COLOR_TUPLE[fg]}")
+    if bg:
+        css.append(f"background-color:{_COLOR_TUPLE[bg - 10]}")
+    if state & _BOLD:
         css.append("font-weight:600")
-    if state.get("dim"):
+    if state & _DIM:
         css.append("opacity:0.8")
-    if state.get("italic"):
+    if state & _ITALIC:
         css.append("font-style:italic")
-    if state.get("underline"):
+    if state & _UNDERLINE:
         css.append("text-decoration:underline")
     return ";".join(css)
 
@@ -123,31 +125,28 @@ def ansi_to_html(s: str) -> str:
     """Convert ANSI-colored text to escaped HTML with <span> styles.
     Keeps newlines; safe to inject as innerHTML.
     """
+    if "\x1b[" not in s:  # no SGR sequences: plain escaped text
+        return _escape(s)
+
     out: list[str] = []
-    pos = 0
-    state: Dict[str, object] = {}
+    append = out.append
+    state = 0
     open_style = ""
 
-    def open_span(new_style: str):
-        nonlocal open_style
+    # One pass yields both SGR sequences and the text runs between them
+    for m in _TOKEN_RE.finditer(s):
+        text = m.group("text")
+        if text is not None:
+            append(_escape(text))
+            continue
+
+        state = _apply_codes(state, m.group("codes"))
         if open_style:
-            out.append("</span>")
-            open_style = ""
-        if new_style:
-            out.append(f'<span style="{new_style}">')
-            open_style = new_style
-
-    for m in _SGR_RE.finditer(s):
-        if m.start() > pos:
-            out.append(html.escape(s[pos : m.start()]))
-
-        _style_from_codes(m.group("codes"), state)
-        open_span(_css_from_state(state))
-        pos = m.end()
-
-    # tail
-    if pos < len(s):
-        out.append(html.escape(s[pos:]))
+            append("</span>")
+        open_style = _css_from_state(state)
+        if open_style:
+            append(f'<span style="{open_style}">')
+
     if open_style:
-        out.append("</span>")
+        append("</span>")
     return "".join(out)
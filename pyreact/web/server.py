@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 import time
 from contextlib import asynccontextmanager
 
@@ -23,6 +24,9 @@ from .ws_endpoint import (
 from .input_consumer import InputConsumer
 from .templates import BASE_HTML
 
+_MESSAGE_PREFIX = "__MESSAGE__:"
+_MESSAGE_RE = re.compile(r"^__MESSAGE__:(.*)$", re.MULTILINE)
+
 
 def create_fastapi_app(runner: AppRunner):
     """Create the FastAPI app with lifecycle via ``lifespan``.
@@ -41,14 +45,17 @@ def create_fastapi_app(runner: AppRunner):
         enable_web_print()
 
         async def _broadcast_stdout(text: str) -> None:
-            if text.startswith("__MESSAGE__:"):
-                message_json = text[12:]  # Remove "__MESSAGE__:"
-                message_data = json.loads(message_json)
-
-                await broadcast.publish(
-                    ChannelName.MSG,
-                    {"channel": "chat", "type": "message", "data": message_data},
-                )
+            if text.startswith(_MESSAGE_PREFIX):
+                # One pass over the chunk; it may carry several marker lines
+                for m in _MESSAGE_RE.finditer(text):
+                    try:
+                        message_data = json.loads(m.group(1))
+                    except Exception:
+                        continue
+                    await broadcast.publish(
+                        ChannelName.MSG,
+                        {"channel": "chat", "type": "message", "data": message_data},
+                    )
                 return
 
             await broadcast.publish(
@@ -34,6 +34,21 @@ def _is_parametrized(path: str) -> bool:
     return ":" in path or path.endswith("*")
 
 
+def _routes_mapper(routes: List[Dict[str, Any]]) -> List[Path]:
+    catalog: List[Path] = []
+    for route in routes:
+        catalog.append(
+            {
+                "path": route.get("path") or "",
+                "description": route.get("description") or "",
+                "utterances": route.get("utterances") or [],
+                "params": route.get("params"),
+            }
+        )
+
+    return catalog
+
+
 @component
 def RouterAgent(*, message: str, on_navigate: Callable[[str, int], None]):
     catalog = use_routes_catalog() or []
@@ -45,24 +60,13 @@ def RouterAgent(*, message: str, on_navigate: Callable[[str, int], None]):
         choose_mod, model="fast"
     )
 
-    def _routes_mapper(routes: List[Dict[str, Any]]) -> List[Path]:
-        catalog: List[str] = []
-        for route in routes:
-            catalog.append(
-                {
-                    "path": route.get("path") or "",
-                    "description": route.get("description") or "",
-                    "utterances": route.get("utterances") or [],
-                    "params": route.get("params"),
-                }
-            )
-
-        return catalog
+    # Router keeps the catalog object stable, so map it only when it changes
+    possible_routes = hooks.use_memo(lambda: _routes_mapper(catalog), [catalog])
 
     def _effect_decide():
         if not isinstance(message, str) or not message.strip():
             return
-        call_llm(message=message, possible_routes=_routes_mapper(catalog))
+        call_llm(message=message, possible_routes=possible_routes)
 
     hooks.use_effect(_effect_decide, [message])
 
@@ -0,0 +1,38 @@
+from pyreact.router.match import compile_route_table, match_path, match_route_table
+
+
+def _linear(patterns, pathname):
+    for i, (pattern, exact) in enumerate(patterns):
+        ok, params = match_path(pattern, pathname, exact)
+        if ok:
+            return i, params
+    return None
+
+
+def test_fused_table_agrees_with_linear_scan():
+    patterns = (
+        ("/", True),
+        ("/users/:id", True),
+        ("/users/:id/posts/:post", False),
+        ("/files/*", False),
+        ("/about", True),
+    )
+    table = compile_route_table(patterns)
+    assert table is not None
+    for pathname in (
+        "/",
+        "/users/7",
+        "/users/7/posts/3",
+        "/users/7/posts/3/edit",
+        "/files/a/b",
+        "/about",
+        "/missing",
+    ):
+        assert match_route_table(table, pathname) == _linear(patterns, pathname)
+
+
+def test_numbered_backreferences_fall_back_to_linear_scan():
+    patterns = (("/x", True), (r"^/(a+)-\1$", True))
+    assert compile_route_table(patterns) is None
+    assert _linear(patterns, "/aa-aa") == (1, {})
+    assert _linear(patterns, "/aa-a") is None
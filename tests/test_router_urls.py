@@ -0,0 +1,31 @@
+from pyreact.router.router import _build_url
+
+
+def test_plain_path_is_kept_as_is():
+    for path in ("/", "/a", "/a?x=1", "/a?x=1#f", "/a#f", "/a?", "/a#"):
+        assert _build_url(path) == path
+
+
+def test_query_overrides_embedded_query_by_key():
+    assert _build_url("/search?page=1", query={"page": 2}) == "/search?page=2"
+    assert _build_url("/a?x=1&y=1", query={"y": 2}) == "/a?x=1&y=2"
+    assert _build_url("/a?x=1", query={"y": 2}) == "/a?x=1&y=2"
+    assert _build_url("/a?", query={"y": 2}) == "/a?y=2"
+    assert _build_url("/a", query={"y": 2, "z": None}) == "/a?y=2"
+
+
+def test_fragment_argument_replaces_embedded_fragment():
+    assert _build_url("/a?x=1#old", query={"y": 2}) == "/a?x=1&y=2#old"
+    assert _build_url("/a?x=1#old", fragment="new") == "/a?x=1#new"
+
+
+def test_params_are_substituted_by_whole_name():
+    assert _build_url("/u/:id/:idx", {"id": 7, "idx": 8}) == "/u/7/8"
+    assert _build_url("/u/:id/:idx", {"id": 7}) == "/u/7/:idx"
+
+
+def test_absolute_urls_follow_the_same_rules():
+    url = "http://h/a?x=1#old"
+    assert _build_url(url, query={"y": 2}) == "http://h/a?x=1&y=2#old"
+    assert _build_url(url, query={"x": 2}) == "http://h/a?x=2#old"
+    assert _build_url(url, fragment="new") == "http://h/a?x=1#new"